@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import logging
-import os
 from typing import Any, Dict
 
-import yaml
-
 from agents.base import BaseAgent
 from analytics import MicrostructureProfiler, RegimeClassifier, StressTester
 from core.state import PairSnapshot
+from core.config_loader import load_config
 from exchange.data_feed import DataFeed
 from monitoring.data_quality import DataQualityMonitor
 from notifications.telegram import send_telegram_message
@@ -34,17 +32,15 @@ class MarketDataAgent(BaseAgent):
 
     @staticmethod
     def _load_monitoring_config() -> Dict[str, Any]:
-        path = "config/monitoring.yaml"
-        if not os.path.exists(path):
-            return {}
-        with open(path, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
+        cfg = load_config("monitoring", required=False)
         monitoring_cfg = cfg.get("monitoring", {})
         return monitoring_cfg.get("data_quality", cfg.get("data_quality", {}))
 
     async def step(self) -> None:
         for symbol in self.symbols:
-            ps = self.ctx.state.pairs.setdefault(symbol, PairSnapshot(symbol=symbol))
+            ps = self.ctx.state.pairs.get(symbol)
+            if ps is None:
+                ps = self.ctx.state.pairs[symbol] = PairSnapshot(symbol=symbol)
             ohlcv = await self.feed.get_recent_ohlcv(symbol, timeframe="5m", limit=180)
             if not ohlcv:
                 continue
@@ -89,4 +85,4 @@ class MarketDataAgent(BaseAgent):
                         f"Gap={gap_sec:.1f}s stale={stale}"
                     )
                     logger.warning(msg)
-                    await send_telegram_message(msg)
+                    send_telegram_message(msg)
@@ -93,7 +93,9 @@ class MlAgent(BaseAgent):
                 continue
 
             signal = strat.generate_signal(ohlcv)
-            ps = self.ctx.state.pairs.setdefault(sym, PairSnapshot(symbol=sym))
+            ps = self.ctx.state.pairs.get(sym)
+            if ps is None:
+                ps = self.ctx.state.pairs[sym] = PairSnapshot(symbol=sym)
 
             meta = ps.meta or {}
             meta["ml_signal"] = {
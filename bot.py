@@ -3,6 +3,10 @@ import logging
 import os
 from logging.handlers import RotatingFileHandler
 from dotenv import load_dotenv
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
 
 # Load .env file at startup
 load_dotenv()
@@ -24,4 +28,8 @@ logging.basicConfig(
 )
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (libuv) replaces the pure-Python selector loop when available.
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,14 +1,15 @@
 import asyncio
 import logging
 import os
-
-import yaml
+import signal
+import sys
 
 from core.global_state import get_global_state
 from core.state import AccountState
 from core.runtime import MultiAgentRuntime
 from core.policy import PolicyEngine
 from core.utils import utcnow
+from core.config_loader import aload_config, combined_config_path
 from core.config_watcher import ConfigWatcher
 from metrics.server import start_metrics_server
 from reports.daily_pnl import schedule_daily_pnl_task
@@ -20,43 +21,36 @@ async def main() -> None:
     state = get_global_state()
     state.mode = os.getenv("BOT_MODE", "paper")
 
+    # Load startup config off the event loop (config/config.yaml, or the legacy per-section files in parallel)
+    cfg = await aload_config("accounts", "policies", "metrics", "reports")
+
     # Load accounts
-    with open("config/accounts.yaml", "r", encoding="utf-8") as f:
-        accounts_cfg = yaml.safe_load(f).get("accounts", {})
-    for name, cfg in accounts_cfg.items():
-        equity = float(cfg.get("equity", 0.0))
-        balance = float(cfg.get("balance", equity))
-        state.accounts.setdefault(
-            name,
-            AccountState(
+    accounts_cfg = cfg.get("accounts", {})
+    for name, acct_cfg in accounts_cfg.items():
+        name = sys.intern(name)
+        equity = float(acct_cfg.get("equity", 0.0))
+        balance = float(acct_cfg.get("balance", equity))
+        if name not in state.accounts:
+            state.accounts[name] = AccountState(
                 name=name,
                 equity=equity,
                 balance=balance,
-                max_drawdown_pct=float(cfg.get("max_drawdown_pct", -20.0)),
-                risk_multiplier=float(cfg.get("risk_multiplier", 1.0)),
-            ),
-        )
+                max_drawdown_pct=float(acct_cfg.get("max_drawdown_pct", -20.0)),
+                risk_multiplier=float(acct_cfg.get("risk_multiplier", 1.0)),
+            )
 
     # Policy engine
-    with open("config/policies.yaml", "r", encoding="utf-8") as f:
-        pol_cfg = yaml.safe_load(f)
-    policy_engine = PolicyEngine.from_yaml(pol_cfg)
-
-    # Hot-reload watcher
-    cfg_watcher = ConfigWatcher(state, policy_engine)
-    watcher_task = asyncio.create_task(cfg_watcher.watch_loop())
+    policy_engine = PolicyEngine.from_yaml(cfg)
 
     # Metrics
-    with open("config/metrics.yaml", "r", encoding="utf-8") as f:
-        metrics_cfg = yaml.safe_load(f).get("metrics", {})
+    metrics_cfg = cfg.get("metrics", {})
     if metrics_cfg.get("enabled", True):
         port = int(metrics_cfg.get("port", 8001))
         start_metrics_server(port)
         logger.info("Prometheus metrics running on port %s", port)
 
     # Daily PnL task
-    with open("config/reports.yaml", "r", encoding="utf-8") as f:
-        reports_cfg = yaml.safe_load(f).get("reports", {})
+    reports_cfg = cfg.get("reports", {})
     daily_cfg = reports_cfg.get("daily_pnl", {})
     if daily_cfg.get("enabled", True):
         schedule_daily_pnl_task(hour_utc=int(daily_cfg.get("hour_utc", 23)),
@@ -64,12 +58,25 @@ async def main() -> None:
 
     logger.info("Starting v200E runtime at %s, mode=%s", utcnow().isoformat(), state.mode)
 
+    # Hot-reload watcher (started only once the initial config load is complete)
+    cfg_watcher = ConfigWatcher(state, policy_engine, config_path=combined_config_path())
+    watcher_task = asyncio.create_task(cfg_watcher.watch_loop())
+
     runtime = MultiAgentRuntime(state, policy_engine)
     await runtime.start()
 
+    # Park until SIGINT/SIGTERM instead of waking up periodically
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):  # pragma: no cover - e.g. Windows event loops
+            pass
+
     try:
-        while True:
-            await asyncio.sleep(3600)
+        await stop_event.wait()
+        logger.info("Shutdown requested")
     except asyncio.CancelledError:
         logger.info("Shutdown requested")
     finally:
@@ -0,0 +1,139 @@
+"""Config file loading.
+
+All sections live under top-level keys of a single ``config/config.yaml``
+(``accounts``, ``policies``, ``metrics``, ``reports``, ``agents``, ``pairs``,
+``monitoring``). When that file is absent, the legacy per-section files
+(``config/<section>.yaml``, each holding its own top-level key) are read and
+merged instead.
+
+Parsed YAML is snapshotted as JSON under ``<config dir>/.cache/`` (when ``orjson``
+is installed); a snapshot is reused for as long as its YAML source bytes match.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import yaml
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader
+
+    logger.warning(
+        "PyYAML was built without libyaml; config parsing falls back to the slow pure-Python loader. "
+        "Install libyaml (e.g. libyaml-dev) and reinstall PyYAML to enable yaml.CSafeLoader."
+    )
+
+CONFIG_DIR = "config"
+COMBINED_CONFIG_PATH = os.path.join(CONFIG_DIR, "config.yaml")
+
+
+def json_cache_path(path: str) -> str:
+    head, tail = os.path.split(path)
+    return os.path.join(head, ".cache", os.path.splitext(tail)[0] + ".json")
+
+
+def source_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _write_json_cache(cache_path: str, digest: str, cfg: Dict[str, Any]) -> None:
+    try:
+        # Dates/times raise here instead of silently turning into strings
+        payload = orjson.dumps({"source": digest, "config": cfg}, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except TypeError:
+        return  # not JSON-representable; this file always goes through YAML
+    # orjson writes NaN/±Infinity as null without raising; only cache exact round-trips
+    # (NaN != NaN, so NaN values fail this check too).
+    if orjson.loads(payload)["config"] != cfg:
+        return
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.debug("Could not write config cache %s: %s", cache_path, exc)
+
+
+def load_yaml_cached(path: str, data: Optional[bytes] = None, digest: Optional[str] = None) -> Dict[str, Any]:
+    """Parse a YAML config, reusing its JSON snapshot while the YAML bytes are unchanged.
+
+    Callers that already hold the file contents pass them as ``data``, plus their
+    ``source_digest(data)`` as ``digest`` if they computed it.
+    """
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+    if orjson is None:
+        return yaml.load(data, Loader=SafeLoader) or {}
+
+    cache_path = json_cache_path(path)
+    if digest is None:
+        digest = source_digest(data)
+    try:
+        with open(cache_path, "rb") as f:
+            cached = orjson.loads(f.read())
+        if cached.get("source") == digest:
+            return cached["config"]
+    except (OSError, orjson.JSONDecodeError, AttributeError, KeyError):
+        pass
+
+    cfg = yaml.load(data, Loader=SafeLoader) or {}
+    _write_json_cache(cache_path, digest, cfg)
+    return cfg
+
+
+def combined_config_path(config_dir: str = CONFIG_DIR) -> str | None:
+    """Path of the combined config file, or None when running on legacy per-section files."""
+    path = os.path.join(config_dir, "config.yaml")
+    return path if os.path.exists(path) else None
+
+
+def _legacy_paths(sections: Iterable[str], config_dir: str, required: bool) -> List[str]:
+    paths = [os.path.join(config_dir, f"{section}.yaml") for section in sections]
+    if required:
+        return paths
+    return [p for p in paths if os.path.exists(p)]
+
+
+def _merge(docs: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    merged: Dict[str, Any] = {}
+    for doc in docs:
+        merged.update(doc)
+    return merged
+
+
+def load_config(*sections: str, config_dir: str = CONFIG_DIR, required: bool = True) -> Dict[str, Any]:
+    """Return a dict keyed by section name.
+
+    With ``required=False`` missing legacy files are skipped instead of raising.
+    """
+    combined = combined_config_path(config_dir)
+    if combined is not None:
+        return load_yaml_cached(combined)
+    return _merge(load_yaml_cached(p) for p in _legacy_paths(sections, config_dir, required))
+
+
+async def aload_config(*sections: str, config_dir: str = CONFIG_DIR, required: bool = True) -> Dict[str, Any]:
+    """Async ``load_config``: parsing runs in worker threads, legacy files in parallel."""
+    combined = combined_config_path(config_dir)
+    if combined is not None:
+        return await asyncio.to_thread(load_yaml_cached, combined)
+    docs = await asyncio.gather(
+        *(asyncio.to_thread(load_yaml_cached, p) for p in _legacy_paths(sections, config_dir, required))
+    )
+    return _merge(docs)
@@ -3,10 +3,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from typing import Dict
+from typing import Any, Callable, Dict, Optional
 
-import yaml
+from watchfiles import Change, awatch
 
+from core.config_loader import load_yaml_cached, source_digest
 from core.policy import PolicyEngine
 from core.state import AccountState, GlobalState
 
@@ -14,7 +15,14 @@ logger = logging.getLogger(__name__)
 
 
 class ConfigWatcher:
-    """Lightweight watcher that hot-reloads accounts and policy configs."""
+    """Lightweight watcher that hot-reloads accounts and policy configs.
+
+    With ``config_path`` set, both sections are read from that single combined
+    file; otherwise the legacy ``accounts_path``/``policies_path`` files are used.
+
+    Change notifications come from the OS (inotify/FSEvents/ReadDirectoryChangesW)
+    via ``watchfiles``, so the loop stays idle until a watched file is touched.
+    """
 
     def __init__(
         self,
@@ -23,65 +31,111 @@ class ConfigWatcher:
         *,
         accounts_path: str = "config/accounts.yaml",
         policies_path: str = "config/policies.yaml",
-        interval_sec: float = 30.0,
+        config_path: Optional[str] = None,
+        debounce_ms: int = 200,
+        step_ms: int = 50,
     ) -> None:
         self.state = state
         self.policy_engine = policy_engine
         self.accounts_path = accounts_path
         self.policies_path = policies_path
-        self.interval_sec = interval_sec
-        self._mtimes: Dict[str, float] = {}
-        self._stopped = False
+        self.config_path = config_path
+        self.debounce_ms = debounce_ms
+        self.step_ms = step_ms
+        self._digests: Dict[str, str] = {}
+        self._stop_event = asyncio.Event()
 
     def _yaml_if_changed(self, path: str) -> Dict | None:
         if not os.path.exists(path):
             return None
 
-        mtime = os.path.getmtime(path)
-        if self._mtimes.get(path) == mtime:
+        # Content digest rather than mtime: editors often rewrite identical bytes on save.
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = source_digest(data)
+        if self._digests.get(path) == digest:
             return None
 
-        with open(path, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
-        self._mtimes[path] = mtime
+        cfg = load_yaml_cached(path, data=data, digest=digest)
+        self._digests[path] = digest
         return cfg
 
-    def _reload_accounts(self) -> None:
-        cfg = self._yaml_if_changed(self.accounts_path)
-        if cfg is None:
-            return
-
+    def _apply_accounts(self, cfg: Dict[str, Any]) -> None:
         accounts_cfg = cfg.get("accounts", {})
         for name, acct_cfg in accounts_cfg.items():
-            acct = self.state.accounts.setdefault(name, AccountState(name=name))
+            acct = self.state.accounts.get(name)
+            if acct is None:
+                acct = self.state.accounts[name] = AccountState(name=name)
             acct.max_drawdown_pct = float(acct_cfg.get("max_drawdown_pct", acct.max_drawdown_pct))
             acct.risk_multiplier = float(acct_cfg.get("risk_multiplier", acct.risk_multiplier))
 
         logger.info("Hot-reloaded accounts config for %s accounts", len(accounts_cfg))
 
+    def _apply_policies(self, cfg: Dict[str, Any]) -> None:
+        new_engine = PolicyEngine.from_yaml(cfg)
+        self.policy_engine.config = new_engine.config
+        logger.info("Hot-reloaded policy config")
+
+    def _reload_accounts(self) -> None:
+        cfg = self._yaml_if_changed(self.accounts_path)
+        if cfg is not None:
+            self._apply_accounts(cfg)
+
     def _reload_policies(self) -> None:
         cfg = self._yaml_if_changed(self.policies_path)
+        if cfg is not None:
+            self._apply_policies(cfg)
+
+    def _reload_combined(self) -> None:
+        cfg = self._yaml_if_changed(self.config_path)
         if cfg is None:
             return
-
-        new_engine = PolicyEngine.from_yaml(cfg)
-        self.policy_engine.config = new_engine.config
-        logger.info("Hot-reloaded policy config")
+        if "accounts" in cfg:
+            self._apply_accounts(cfg)
+        if "policies" in cfg:
+            self._apply_policies(cfg)
 
     def reload_once(self) -> None:
+        if self.config_path:
+            self._reload_combined()
+            return
         self._reload_accounts()
         self._reload_policies()
 
     async def watch_loop(self) -> None:
-        while not self._stopped:
-            try:
-                self.reload_once()
-                await asyncio.sleep(self.interval_sec)
-            except asyncio.CancelledError:
-                self._stopped = True
-                break
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("Config watcher error: %s", exc)
+        # Watch the parent directories rather than the files themselves so editors
+        # that save via rename-and-replace keep triggering reloads.
+        handlers: Dict[str, Callable[[], None]]
+        if self.config_path:
+            handlers = {os.path.abspath(self.config_path): self._reload_combined}
+        else:
+            handlers = {
+                os.path.abspath(self.accounts_path): self._reload_accounts,
+                os.path.abspath(self.policies_path): self._reload_policies,
+            }
+        dirs = sorted({os.path.dirname(path) for path in handlers})
+
+        def _only_watched(_change: Change, path: str) -> bool:
+            return path in handlers
+
+        try:
+            async for changes in awatch(
+                *dirs,
+                watch_filter=_only_watched,
+                debounce=self.debounce_ms,
+                step=self.step_ms,
+                stop_event=self._stop_event,
+                recursive=False,
+            ):
+                for path in {path for _, path in changes}:
+                    try:
+                        handlers[path]()
+                    except Exception as exc:  # noqa: BLE001
+                        logger.warning("Config watcher error for %s: %s", path, exc)
+        except asyncio.CancelledError:
+            self._stop_event.set()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Config watcher stopped: %s", exc)
 
     def stop(self) -> None:
-        self._stopped = True
+        self._stop_event.set()
@@ -1,15 +1,8 @@
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass
+import time
 from datetime import datetime, timedelta
-from typing import Deque, Optional
-
-
-@dataclass
-class LossEvent:
-    ts: datetime
-    pnl: float
+from typing import List, Optional
 
 
 class LossClusterTracker:
@@ -23,6 +16,11 @@ class LossClusterTracker:
     Notes:
     - This tracker is intentionally exchange/strategy-agnostic.
     - You can feed it from any confirmed trade outcome source.
+    - Loss timestamps are ``time.monotonic()`` seconds; only the count inside the
+      window matters, so individual pnl values are not retained.
+    - Timestamps live in a preallocated ring buffer sized at 4x the largest
+      threshold; once full the oldest entry is overwritten, so the window count
+      saturates there (thresholds are still reached and reported correctly).
     """
 
     def __init__(
@@ -34,48 +32,72 @@ class LossClusterTracker:
         throttle_multiplier: float = 0.25,
     ) -> None:
         self.window = timedelta(minutes=int(window_minutes))
+        self._window_s = self.window.total_seconds()
         self.throttle_losses = int(throttle_losses)
         self.pause_losses = int(pause_losses)
         self.pause_duration = timedelta(minutes=int(pause_minutes))
+        self._pause_s = self.pause_duration.total_seconds()
         self._throttle_mult = float(throttle_multiplier)
 
-        self._losses: Deque[LossEvent] = deque()
-        self._pause_until: Optional[datetime] = None
+        capacity = 4 * max(self.throttle_losses, self.pause_losses, 1)
+        self._loss_ts: List[float] = [0.0] * capacity
+        self._head = 0  # next write slot
+        self._size = 0  # live entries, oldest at (head - size) % capacity
+        self._pause_until: Optional[datetime] = None  # wall-clock, for reporting only
+        self._pause_deadline: Optional[float] = None  # monotonic, checked on every tick
 
-    def record_outcome(self, pnl: float, ts: Optional[datetime] = None) -> None:
-        """Record a confirmed trade outcome (pnl). Negative pnl counts as a loss."""
+    def record_outcome(self, pnl: float, ts: Optional[float] = None) -> None:
+        """Record a confirmed trade outcome (pnl). Negative pnl counts as a loss.
+
+        ``ts`` is a ``time.monotonic()`` reading; defaults to now.
+        """
         if pnl is None:
             return
-        ts = ts or datetime.utcnow()
+        ts = time.monotonic() if ts is None else ts
         self._prune(ts)
         if float(pnl) < 0.0:
-            self._losses.append(LossEvent(ts=ts, pnl=float(pnl)))
-            self._prune(ts)
-            if len(self._losses) >= self.pause_losses:
-                self._pause_until = ts + self.pause_duration
+            capacity = len(self._loss_ts)
+            self._loss_ts[self._head] = ts
+            self._head = (self._head + 1) % capacity
+            if self._size < capacity:
+                self._size += 1
+            if self._size >= self.pause_losses:
+                self._pause_deadline = ts + self._pause_s
+                # Wall-clock view of the same deadline (``ts`` may be a caller-supplied monotonic reading)
+                self._pause_until = datetime.utcnow() + timedelta(seconds=self._pause_deadline - time.monotonic())
 
-    def _prune(self, now: datetime) -> None:
-        while self._losses and (now - self._losses[0].ts) > self.window:
-            self._losses.popleft()
+    def _prune(self, now: float) -> None:
+        size = self._size
+        if not size:
+            return
+        cutoff = now - self._window_s
+        buf = self._loss_ts
+        capacity = len(buf)
+        tail = (self._head - size) % capacity
+        while size and buf[tail] < cutoff:
+            tail = (tail + 1) % capacity
+            size -= 1
+        self._size = size
 
-    def should_pause(self, now: Optional[datetime] = None) -> bool:
-        now = now or datetime.utcnow()
-        return self._pause_until is not None and now < self._pause_until
+    def should_pause(self, now: Optional[float] = None) -> bool:
+        deadline = self._pause_deadline
+        if deadline is None:
+            return False
+        return (time.monotonic() if now is None else now) < deadline
 
     def pause_until(self) -> Optional[datetime]:
         return self._pause_until
 
-    def throttle_multiplier(self, now: Optional[datetime] = None) -> float:
-        now = now or datetime.utcnow()
-        self._prune(now)
-        if len(self._losses) >= self.throttle_losses:
+    def throttle_multiplier(self, now: Optional[float] = None) -> float:
+        self._prune(time.monotonic() if now is None else now)
+        if self._size >= self.throttle_losses:
             return self._throttle_mult
         return 1.0
 
     def snapshot(self) -> dict:
         """Small serializable snapshot for metrics/debug."""
         return {
-            "loss_count_window": len(self._losses),
+            "loss_count_window": self._size,
             "pause_until": self._pause_until.isoformat() if self._pause_until else None,
             "throttle_mult": self._throttle_mult,
             "window_minutes": int(self.window.total_seconds() // 60),
@@ -1,11 +1,11 @@
 import asyncio
 import logging
+import sys
 from typing import List
 
-import yaml
-
 from core.state import GlobalState
 from core.policy import PolicyEngine
+from core.config_loader import load_config
 from core.allocator import compute_risk_multiplier, AllocatorConfig
 from core.live_metrics import on_intent, on_intent_dropped, on_allocator, on_eligibility
 from agents.base import Agent, AgentContext
@@ -42,12 +42,10 @@ class MultiAgentRuntime:
     async def start(self) -> None:
         ctx = AgentContext(state=self.state, policy=self.policy)
 
-        with open("config/agents.yaml", "r", encoding="utf-8") as f:
-            agent_cfg = yaml.safe_load(f).get("agents", {})
-
-        with open("config/pairs.yaml", "r", encoding="utf-8") as pf:
-            pair_cfg = yaml.safe_load(pf).get("pairs", [])
-        symbols = [p["symbol"] for p in pair_cfg if p.get("enabled", False)]
+        cfg = load_config("agents", "pairs")
+        agent_cfg = cfg.get("agents", {})
+        pair_cfg = cfg.get("pairs", [])
+        symbols = [sys.intern(p["symbol"]) for p in pair_cfg if p.get("enabled", False)]
 
         if agent_cfg.get("market_data", True):
             self.agents.append(MarketDataAgent("market_data", ctx, symbols, interval=5.0))
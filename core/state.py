@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 from collections import deque
@@ -7,7 +8,7 @@ from collections import deque
 from core.loss_cluster import LossClusterTracker
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionSnapshot:
     symbol: str
     size: float = 0.0
@@ -17,7 +18,7 @@ class PositionSnapshot:
     meta: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountState:
     name: str
     equity: float = 0.0
@@ -29,8 +30,13 @@ class AccountState:
     risk_multiplier: float = 1.0
     meta: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Account/pair names key dicts all over the hot loops; interning caches the hash
+        # and lets equal keys compare by identity.
+        self.name = sys.intern(self.name)
 
-@dataclass
+
+@dataclass(slots=True)
 class PairSnapshot:
     symbol: str
     last_price: float | None = None
@@ -45,8 +51,11 @@ class PairSnapshot:
     stress_multiplier: float = 1.0
     meta: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        self.symbol = sys.intern(self.symbol)
+
 
-@dataclass
+@dataclass(slots=True)
 class GlobalState:
     accounts: Dict[str, AccountState] = field(default_factory=dict)
     pairs: Dict[str, PairSnapshot] = field(default_factory=dict)
@@ -1,12 +1,36 @@
 from __future__ import annotations
+import math
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
 from datetime import datetime, timezone
 
+import numpy as np
+
 def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
-@dataclass
+@lru_cache(maxsize=32)
+def _timeframe_ms(timeframe: str) -> int:
+    """Expected candle spacing in ms; memoized since feeds only use a handful of timeframes."""
+    unit = timeframe[-1:]
+    try:
+        value = int(timeframe[:-1])
+    except ValueError:
+        return 300_000
+
+    if unit == "s":
+        return value * 1000
+    if unit == "m":
+        return value * 60_000
+    if unit == "h":
+        return value * 3_600_000
+    if unit == "d":
+        return value * 86_400_000
+    return 300_000
+
+@dataclass(slots=True)
 class DataQualityStatus:
     ok: bool = True
     reason: str = "OK"
@@ -14,9 +38,43 @@ class DataQualityStatus:
     meta: Dict[str, Any] = field(default_factory=dict)
 
 class DataQualityMonitor:
-    def __init__(self, **kwargs: Any) -> None:
-        # Accept but ignore legacy parameters for backward compatibility
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        alert_interval_sec: float = 1800.0,
+        gap_multiplier: float = 1.4,
+        stale_multiplier: float = 2.0,
+        **kwargs: Any,
+    ) -> None:
+        # Accept but ignore other legacy parameters for backward compatibility
+        self.enabled = enabled
+        self.alert_interval_sec = alert_interval_sec
+        self.gap_multiplier = gap_multiplier
+        self.stale_multiplier = stale_multiplier
         self._by_symbol: Dict[str, DataQualityStatus] = {}
+        self._last_alert: Dict[Tuple[str, str], float] = {}
+        # Per-timeframe (gap, stale) limits in whole ms; for integer ms values
+        # ``x > expected * mult`` is equivalent to ``x > floor(expected * mult)``.
+        self._limits_ms: Dict[str, Tuple[int, int]] = {}
+
+    def _thresholds_ms(self, timeframe: str) -> Tuple[int, int]:
+        limits = self._limits_ms.get(timeframe)
+        if limits is None:
+            expected_ms = _timeframe_ms(timeframe)
+            limits = (
+                math.floor(expected_ms * self.gap_multiplier),
+                math.floor(expected_ms * self.stale_multiplier),
+            )
+            self._limits_ms[timeframe] = limits
+        return limits
+
+    def _should_alert(self, key: Tuple[str, str], now_s: float) -> bool:
+        last = self._last_alert.get(key, 0)
+        if now_s - last >= self.alert_interval_sec:
+            self._last_alert[key] = now_s
+            return True
+        return False
 
     def update(self, symbol: str, **meta: Any) -> None:
         st = self._by_symbol.get(symbol) or DataQualityStatus()
@@ -35,30 +93,82 @@ class DataQualityMonitor:
         self._by_symbol[symbol] = st
 
     def is_ok(self, symbol: str) -> bool:
-        return (self._by_symbol.get(symbol) or DataQualityStatus()).ok
+        st = self._by_symbol.get(symbol)
+        return True if st is None else st.ok
 
     def status(self, symbol: str) -> DataQualityStatus:
         """Get the current status for a symbol."""
         return self._by_symbol.get(symbol) or DataQualityStatus()
 
     def evaluate(self, symbol: str, timeframe: str, ohlcv: Any) -> Optional[Dict[str, Any]]:
-        """Backward compatibility method for existing code.
-        
-        This method provides a compatibility layer for code that uses the old API.
-        For new code, use update() and status() methods instead.
+        """Check the latest candles for gaps/staleness and return a status dict.
+
+        The dict carries ``last_ts``, ``gap_ms``, ``gap``, ``stale`` and ``alert``
+        (alerts are rate-limited per symbol/timeframe by ``alert_interval_sec``).
         """
-        if not ohlcv or len(ohlcv) < 2:
+        if not self.enabled or not ohlcv or len(ohlcv) < 2:
             return None
-        
-        # Update status when data is available
-        self.update(symbol, timeframe=timeframe, ohlcv_count=len(ohlcv))
-        
-        # Return minimal status dict for backward compatibility
-        st = self.status(symbol)
+
+        # One clock read shared by the status stamp, staleness check and alert rate limit
+        now_s = time.time()
+        now_ms = int(now_s * 1000)
+
+        # Update status in place when data is available (same effect as update(), minus the kwargs dict)
+        st = self._by_symbol.get(symbol)
+        if st is None:
+            st = self._by_symbol[symbol] = DataQualityStatus()
+        st.ok = True
+        st.reason = "OK"
+        st.last_update = datetime.fromtimestamp(now_s, timezone.utc).isoformat()
+        meta = st.meta
+        meta["timeframe"] = timeframe
+        meta["ohlcv_count"] = len(ohlcv)
+
+        gap_limit_ms, stale_limit_ms = self._thresholds_ms(timeframe)
+        last_ts = int(ohlcv[-1][0])
+        gap_ms = last_ts - int(ohlcv[-2][0])
+
+        gap_detected = gap_ms > gap_limit_ms
+        stale = (now_ms - last_ts) > stale_limit_ms
+
+        alert = False
+        if gap_detected or stale:
+            alert = self._should_alert((symbol, timeframe), now_s)
+
         return {
-            "last_ts": 0,
-            "gap_ms": 0,
-            "gap": False,
-            "stale": not st.ok,
-            "alert": not st.ok,
+            "last_ts": last_ts,
+            "gap_ms": gap_ms,
+            "gap": gap_detected,
+            "stale": stale,
+            "alert": alert,
         }
+
+    def evaluate_batch(
+        self,
+        symbols: Sequence[str],
+        timeframes: Sequence[str],
+        last_ts: Any,
+        prev_ts: Any,
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """Vectorised ``evaluate`` for many symbols whose latest two bar timestamps are already known.
+
+        ``last_ts``/``prev_ts`` are int millisecond arrays aligned with ``symbols``/``timeframes``.
+        Returns ``gap_ms`` plus boolean ``gap``/``stale``/``alert`` masks; per-symbol status
+        (``update``/``status``) is not touched.
+        """
+        if not self.enabled:
+            return None
+
+        last = np.asarray(last_ts, dtype=np.int64)
+        gap_ms = last - np.asarray(prev_ts, dtype=np.int64)
+        limits = np.array([self._thresholds_ms(tf) for tf in timeframes], dtype=np.int64).reshape(-1, 2)
+
+        now_s = time.time()
+        gap = gap_ms > limits[:, 0]
+        stale = (int(now_s * 1000) - last) > limits[:, 1]
+
+        alert = np.zeros(len(last), dtype=bool)
+        for i in np.flatnonzero(gap | stale):
+            alert[i] = self._should_alert((symbols[i], timeframes[i]), now_s)
+
+        return {"gap_ms": gap_ms, "gap": gap, "stale": stale, "alert": alert}
@@ -0,0 +1 @@
+from .daily_pnl import schedule_daily_pnl_task, send_daily_pnl_report
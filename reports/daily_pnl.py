@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from core.global_state import get_global_state
+from core.utils import utcnow
+from notifications.telegram import send_telegram_message
+
+logger = logging.getLogger(__name__)
+
+# Refuse to re-arm for less than this, so a timer that fires a hair early
+# (monotonic vs wall-clock drift) cannot send the same day's report twice.
+_MIN_REARM_SEC = 60.0
+
+
+def send_daily_pnl_report() -> bool:
+    st = get_global_state()
+    text = (
+        "📊 DAILY PnL REPORT\n"
+        f"Date: {utcnow().date()}\n\n"
+        f"Realized PnL: {st.total_realized_pnl:.2f} AUD\n"
+        f"Unrealized PnL: {st.total_unrealized_pnl:.2f} AUD\n"
+        f"Trading Enabled: {st.trading_enabled}\n"
+    )
+    return send_telegram_message(text)
+
+
+def seconds_until(hour_utc: int, minute_utc: int, now: Optional[datetime] = None) -> float:
+    """Seconds from ``now`` until the next HH:MM UTC (always in the future)."""
+    now = now or utcnow()
+    target = now.replace(hour=hour_utc, minute=minute_utc, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+def schedule_daily_pnl_task(hour_utc: int, minute_utc: int) -> None:
+    """Arm a single loop timer for the next report; each firing re-arms exactly once."""
+    loop = asyncio.get_running_loop()
+
+    def _arm() -> None:
+        delay = seconds_until(hour_utc, minute_utc)
+        if delay < _MIN_REARM_SEC:
+            delay += 86_400.0
+        loop.call_at(loop.time() + delay, _fire)
+
+    def _fire() -> None:
+        logger.info("Daily PnL report trigger at %s", utcnow().isoformat())
+        try:
+            send_daily_pnl_report()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Daily PnL report failed: %s", exc)
+        _arm()
+
+    loop.call_at(loop.time() + seconds_until(hour_utc, minute_utc), _fire)
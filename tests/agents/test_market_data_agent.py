@@ -0,0 +1,32 @@
+import asyncio
+import time
+
+
+class StaleFeed:
+    async def get_recent_ohlcv(self, symbol, timeframe="5m", limit=180):  # noqa: ANN001
+        old_ms = int(time.time() * 1000) - 6 * 3_600_000
+        return [[old_ms - (180 - i) * 300_000, 10.0, 11.0, 9.0, 10.0 + i * 0.01, 1.0] for i in range(180)]
+
+
+def test_step_alerts_and_updates_every_symbol(monkeypatch):
+    import agents.market_data as market_data_mod
+    from agents.base import AgentContext
+    from core.policy import PolicyEngine
+    from core.state import GlobalState
+
+    sent = []
+    monkeypatch.setattr(market_data_mod, "send_telegram_message", lambda msg: sent.append(msg) or False)
+
+    state = GlobalState()
+    ctx = AgentContext(state=state, policy=PolicyEngine.from_yaml({"policies": {}}))
+    agent = market_data_mod.MarketDataAgent("market_data", ctx, ["SOL/AUD", "BTC/AUD"])
+    agent.feed = StaleFeed()
+
+    asyncio.run(agent.step())
+
+    assert len(sent) == 2
+    for symbol in ("SOL/AUD", "BTC/AUD"):
+        assert state.pairs[symbol].last_price is not None
+        status = state.meta["data_quality"][symbol]["5m"]
+        assert status["stale"] is True
+        assert status["alert"] is True
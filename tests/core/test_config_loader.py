@@ -0,0 +1,68 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from core.config_loader import aload_config, combined_config_path, load_config
+
+
+def test_combined_file_takes_precedence(tmp_path: Path) -> None:
+    (tmp_path / "config.yaml").write_text("accounts:\n  paper: {equity: 1}\npairs:\n  - symbol: X/Y\n")
+    (tmp_path / "accounts.yaml").write_text("accounts:\n  legacy: {equity: 2}\n")
+
+    assert combined_config_path(str(tmp_path)) == str(tmp_path / "config.yaml")
+    cfg = load_config("accounts", "pairs", config_dir=str(tmp_path))
+    assert cfg["accounts"] == {"paper": {"equity": 1}}
+    assert cfg["pairs"] == [{"symbol": "X/Y"}]
+
+
+def test_legacy_files_are_merged_when_combined_absent(tmp_path: Path) -> None:
+    (tmp_path / "accounts.yaml").write_text("accounts:\n  paper: {equity: 1}\n")
+    (tmp_path / "policies.yaml").write_text("policies:\n  max_daily_loss_aud: -10\n")
+
+    assert combined_config_path(str(tmp_path)) is None
+    cfg = asyncio.run(aload_config("accounts", "policies", config_dir=str(tmp_path)))
+    assert cfg == {"accounts": {"paper": {"equity": 1}}, "policies": {"max_daily_loss_aud": -10}}
+
+    assert load_config("monitoring", config_dir=str(tmp_path), required=False) == {}
+    with pytest.raises(FileNotFoundError):
+        load_config("monitoring", config_dir=str(tmp_path))
+
+
+def test_yaml_json_snapshot_reused_until_source_changes(tmp_path: Path) -> None:
+    import orjson
+
+    from core.config_loader import json_cache_path, load_yaml_cached
+
+    path = tmp_path / "config.yaml"
+    path.write_text("metrics:\n  port: 8001\n")
+    assert load_yaml_cached(str(path)) == {"metrics": {"port": 8001}}
+
+    cache = Path(json_cache_path(str(path)))
+    snapshot = orjson.loads(cache.read_bytes())
+    assert snapshot["config"] == {"metrics": {"port": 8001}}
+
+    # unchanged source -> served from the snapshot
+    snapshot["config"] = {"metrics": {"port": 1}}
+    cache.write_bytes(orjson.dumps(snapshot))
+    assert load_yaml_cached(str(path)) == {"metrics": {"port": 1}}
+
+    # edited source -> YAML re-parsed and snapshot refreshed
+    path.write_text("metrics:\n  port: 9000\n")
+    assert load_yaml_cached(str(path)) == {"metrics": {"port": 9000}}
+    assert orjson.loads(cache.read_bytes())["config"] == {"metrics": {"port": 9000}}
+
+
+@pytest.mark.parametrize("value", [".inf", "-.inf", ".nan"])
+def test_non_finite_floats_are_never_snapshotted(tmp_path: Path, value: str) -> None:
+    import math
+
+    from core.config_loader import json_cache_path, load_yaml_cached
+
+    path = tmp_path / "policies.yaml"
+    path.write_text(f"policies:\n  max_daily_loss_aud: {value}\n")
+
+    for _ in range(2):
+        loaded = load_yaml_cached(str(path))["policies"]["max_daily_loss_aud"]
+        assert isinstance(loaded, float) and not math.isfinite(loaded)
+    assert not Path(json_cache_path(str(path))).exists()
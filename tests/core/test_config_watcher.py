@@ -78,3 +78,80 @@ policies:
     assert cfg.absolute_max_drawdown_pct == -25.0
     assert cfg.max_single_position_pct == 0.3
     assert cfg.per_symbol_max_loss_aud == -200.0
+
+
+def test_watch_loop_reloads_on_file_change(tmp_path: Path) -> None:
+    import asyncio
+
+    accounts_path = tmp_path / "accounts.yaml"
+    write_yaml(accounts_path, "accounts:\n  paper:\n    risk_multiplier: 1.0\n")
+
+    state = GlobalState(accounts={"paper": AccountState(name="paper", risk_multiplier=1.0)})
+    policy = PolicyEngine.from_yaml({"policies": {}})
+    watcher = ConfigWatcher(
+        state,
+        policy,
+        accounts_path=str(accounts_path),
+        policies_path=str(tmp_path / "policies.yaml"),
+        debounce_ms=10,
+        step_ms=10,
+    )
+
+    async def scenario() -> None:
+        task = asyncio.create_task(watcher.watch_loop())
+        await asyncio.sleep(0.2)
+        write_yaml(accounts_path, "accounts:\n  paper:\n    risk_multiplier: 3.0\n")
+        for _ in range(100):
+            if state.accounts["paper"].risk_multiplier == 3.0:
+                break
+            await asyncio.sleep(0.05)
+        watcher.stop()
+        await asyncio.wait_for(task, timeout=2.0)
+
+    asyncio.run(scenario())
+
+    assert state.accounts["paper"].risk_multiplier == 3.0
+
+
+def test_reload_skips_unchanged_content(tmp_path: Path) -> None:
+    accounts_path = tmp_path / "accounts.yaml"
+    write_yaml(accounts_path, "accounts:\n  paper:\n    risk_multiplier: 2.0\n")
+
+    state = GlobalState(accounts={"paper": AccountState(name="paper", risk_multiplier=1.0)})
+    policy = PolicyEngine.from_yaml({"policies": {}})
+    watcher = ConfigWatcher(state, policy, accounts_path=str(accounts_path), policies_path=str(tmp_path / "policies.yaml"))
+
+    watcher.reload_once()
+    assert state.accounts["paper"].risk_multiplier == 2.0
+
+    # a save that rewrites the same bytes must not re-apply the file
+    state.accounts["paper"].risk_multiplier = 0.5
+    write_yaml(accounts_path, "accounts:\n  paper:\n    risk_multiplier: 2.0\n")
+    current_mtime = os.path.getmtime(accounts_path)
+    os.utime(accounts_path, (current_mtime + 1, current_mtime + 1))
+
+    watcher.reload_once()
+    assert state.accounts["paper"].risk_multiplier == 0.5
+
+
+def test_reload_from_combined_config(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    write_yaml(
+        config_path,
+        """
+accounts:
+  paper:
+    risk_multiplier: 1.5
+policies:
+  max_daily_loss_aud: -75
+""",
+    )
+
+    state = GlobalState(accounts={"paper": AccountState(name="paper")})
+    policy = PolicyEngine.from_yaml({"policies": {}})
+    watcher = ConfigWatcher(state, policy, config_path=str(config_path))
+
+    watcher.reload_once()
+
+    assert state.accounts["paper"].risk_multiplier == 1.5
+    assert policy.config.max_daily_loss_aud == -75.0
@@ -0,0 +1,57 @@
+from core.loss_cluster import LossClusterTracker
+
+
+def test_throttle_counts_only_losses_inside_window():
+    lc = LossClusterTracker(window_minutes=30, throttle_losses=2, pause_losses=5)
+    lc.record_outcome(-1.0, ts=0.0)
+    lc.record_outcome(5.0, ts=60.0)
+    lc.record_outcome(-2.0, ts=120.0)
+    assert lc.throttle_multiplier(now=130.0) == 0.25
+
+    # first loss ages out after 30 minutes
+    assert lc.throttle_multiplier(now=30 * 60 + 1.0) == 1.0
+    assert lc.snapshot()["loss_count_window"] == 1
+
+
+def test_pause_after_loss_cluster():
+    lc = LossClusterTracker(pause_losses=3)
+    for _ in range(2):
+        lc.record_outcome(-1.0)
+    assert not lc.should_pause()
+    lc.record_outcome(-1.0)
+    assert lc.should_pause()
+    assert lc.snapshot()["pause_until"] is not None
+
+
+def test_pause_expires_after_cooldown():
+    lc = LossClusterTracker(pause_losses=2, pause_minutes=60)
+    lc.record_outcome(-1.0, ts=100.0)
+    lc.record_outcome(-1.0, ts=200.0)
+    assert lc.should_pause(now=200.0 + 59 * 60)
+    assert not lc.should_pause(now=200.0 + 60 * 60)
+
+
+def test_ring_buffer_wraps_and_saturates():
+    lc = LossClusterTracker(window_minutes=30, throttle_losses=1, pause_losses=2)
+    for i in range(20):
+        lc.record_outcome(-1.0, ts=float(i))
+    assert lc.snapshot()["loss_count_window"] == 8  # capacity = 4 * max(thresholds)
+    assert lc.should_pause(now=20.0)
+
+    # wrapped entries still age out oldest-first
+    assert lc.throttle_multiplier(now=30 * 60 + 15.5) == 0.25
+    assert lc.snapshot()["loss_count_window"] == 4
+    assert lc.throttle_multiplier(now=30 * 60 + 100.0) == 1.0
+
+
+def test_pause_until_matches_enforced_deadline():
+    import time
+    from datetime import datetime
+
+    lc = LossClusterTracker(pause_losses=1, pause_minutes=60)
+    past = time.monotonic() - 30 * 60  # loss recorded half an hour ago
+    lc.record_outcome(-1.0, ts=past)
+
+    remaining = (lc.pause_until() - datetime.utcnow()).total_seconds()
+    assert abs(remaining - 30 * 60) < 5
+    assert lc.should_pause()
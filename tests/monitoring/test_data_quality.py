@@ -0,0 +1,85 @@
+import time
+
+from monitoring.data_quality import DataQualityMonitor, _timeframe_ms
+
+
+def test_timeframe_ms_parses_and_falls_back() -> None:
+    assert _timeframe_ms("1s") == 1_000
+    assert _timeframe_ms("5m") == 300_000
+    assert _timeframe_ms("4h") == 14_400_000
+    assert _timeframe_ms("1d") == 86_400_000
+    assert _timeframe_ms("bogus") == 300_000
+    assert _timeframe_ms("3w") == 300_000
+
+
+def test_evaluate_flags_gap_and_rate_limits_alerts() -> None:
+    monitor = DataQualityMonitor(alert_interval_sec=600, gap_multiplier=1.4, stale_multiplier=2.0)
+    now_ms = int(time.time() * 1000)
+    ohlcv = [[now_ms - 600_000, 1, 1, 1, 1, 1], [now_ms, 1, 1, 1, 1, 1]]
+
+    status = monitor.evaluate("SOL/AUD", "5m", ohlcv)
+    assert status == {"last_ts": now_ms, "gap_ms": 600_000, "gap": True, "stale": False, "alert": True}
+
+    again = monitor.evaluate("SOL/AUD", "5m", ohlcv)
+    assert again["gap"] is True
+    assert again["alert"] is False
+
+
+def test_evaluate_detects_stale_feed_and_skips_short_input() -> None:
+    monitor = DataQualityMonitor()
+    old_ms = int(time.time() * 1000) - 3_600_000
+    ohlcv = [[old_ms - 300_000, 1, 1, 1, 1, 1], [old_ms, 1, 1, 1, 1, 1]]
+
+    status = monitor.evaluate("SOL/AUD", "5m", ohlcv)
+    assert status["gap"] is False
+    assert status["stale"] is True
+
+    assert monitor.evaluate("SOL/AUD", "5m", ohlcv[:1]) is None
+    assert DataQualityMonitor(enabled=False).evaluate("SOL/AUD", "5m", ohlcv) is None
+
+
+def test_gap_threshold_matches_float_comparison_at_boundary() -> None:
+    monitor = DataQualityMonitor(gap_multiplier=1.4, stale_multiplier=1e9)
+    base = int(time.time() * 1000)
+    limit = 300_000 * 1.4
+
+    at_limit = monitor.evaluate("SOL/AUD", "5m", [[base - int(limit), 0], [base, 0]])
+    past_limit = monitor.evaluate("SOL/AUD", "5m", [[base - int(limit) - 1, 0], [base, 0]])
+
+    assert at_limit["gap"] is (int(limit) > limit)
+    assert past_limit["gap"] is True
+
+
+def test_evaluate_batch_matches_scalar_evaluate() -> None:
+    now_ms = int(time.time() * 1000)
+    symbols = ["SOL/AUD", "BTC/AUD", "ETH/AUD"]
+    timeframes = ["5m", "1m", "1h"]
+    last_ts = [now_ms, now_ms - 3_600_000, now_ms]
+    prev_ts = [now_ms - 300_000, now_ms - 3_660_000, now_ms - 3 * 3_600_000]
+
+    batch = DataQualityMonitor().evaluate_batch(symbols, timeframes, last_ts, prev_ts)
+
+    scalar = DataQualityMonitor()
+    for i, (sym, tf) in enumerate(zip(symbols, timeframes)):
+        expected = scalar.evaluate(sym, tf, [[prev_ts[i], 0], [last_ts[i], 0]])
+        assert int(batch["gap_ms"][i]) == expected["gap_ms"]
+        assert bool(batch["gap"][i]) is expected["gap"]
+        assert bool(batch["stale"][i]) is expected["stale"]
+        assert bool(batch["alert"][i]) is expected["alert"]
+    assert batch["gap"].tolist() == [False, False, True]
+    assert batch["stale"].tolist() == [False, True, False]
+
+
+def test_evaluate_refreshes_symbol_status() -> None:
+    monitor = DataQualityMonitor()
+    assert monitor.is_ok("SOL/AUD")
+    monitor.mark_bad("SOL/AUD", "STALE")
+    assert not monitor.is_ok("SOL/AUD")
+
+    now_ms = int(time.time() * 1000)
+    monitor.evaluate("SOL/AUD", "5m", [[now_ms - 300_000, 0], [now_ms, 0], [now_ms, 0]])
+
+    st = monitor.status("SOL/AUD")
+    assert st.ok and st.reason == "OK"
+    assert st.meta["timeframe"] == "5m"
+    assert st.meta["ohlcv_count"] == 3
@@ -0,0 +1,14 @@
+from datetime import datetime, timezone
+
+from reports.daily_pnl import seconds_until
+
+
+def test_seconds_until_later_today() -> None:
+    now = datetime(2024, 1, 1, 8, 30, tzinfo=timezone.utc)
+    assert seconds_until(9, 0, now=now) == 30 * 60
+
+
+def test_seconds_until_rolls_to_next_day() -> None:
+    now = datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc)
+    assert seconds_until(9, 0, now=now) == 24 * 3600
+    assert seconds_until(8, 59, now=now) == 24 * 3600 - 60